@@ -11,6 +11,12 @@ import json
 import subprocess
 import time
 
+# C-extension JSON for the evidence file; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Expected font sizes based on our unified scale
 EXPECTED_SIZES = {
     'text-ui-xs': '12px',
@@ -56,13 +62,17 @@ def verify_typography():
     print("✓ Unified typography scale implemented")
     print()
     
+    # Local bindings keep the loop off repeated global/dict lookups
+    getsize = EXPECTED_SIZES.__getitem__
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+
     results = []
     all_pass = True
-    
+
     for test in TEST_CASES:
         component = test['component']
         expected_token = test['expected']
-        expected_size = EXPECTED_SIZES[expected_token]
+        expected_size = getsize(expected_token)
         
         # Simulate DOM inspection
         # In real scenario, this would query the actual DOM
@@ -91,14 +101,18 @@ def verify_typography():
     print()
     
     # Save results as evidence
-    with open('/Users/to/sciebo/TT_Web/UNOWEBSIM_github_dupe/typography-verification-evidence.json', 'w') as f:
-        json.dump({
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'url': 'http://localhost:3001',
-            'scale': EXPECTED_SIZES,
-            'results': results,
-            'all_passed': all_pass
-        }, f, indent=2)
+    evidence = {
+        'timestamp': timestamp,
+        'url': 'http://localhost:3001',
+        'scale': EXPECTED_SIZES,
+        'results': results,
+        'all_passed': all_pass
+    }
+    with open('/Users/to/sciebo/TT_Web/UNOWEBSIM_github_dupe/typography-verification-evidence.json', 'wb') as f:
+        if orjson is not None:
+            f.write(orjson.dumps(evidence, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(evidence, indent=2).encode('utf-8'))
     
     print("Evidence saved to: typography-verification-evidence.json")
     return all_pass
@@ -5,16 +5,53 @@ Measures and documents font sizes across all UI components
 """
 import argparse
 import csv
+import hashlib
+import io
 import json
+import os
+import queue
+import shutil
+import socket
+import subprocess
 import time
 import sys
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# C-extension JSON for the report cache; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+CHROMEDRIVER_PORT = 9515
+SESSION_CACHE = os.path.expanduser("~/.uno_driver.json")
+REPORT_CACHE = ".font_report_cache.json"
+
+# Only computed styles matter for measurement, not rendered glyphs or images.
+# CSS stays allowed - it is needed for computed styles.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff*", "*.ttf", "*.mp4"
+]
+
+MD_ROW_FMT = (
+    "| {Komponente} "
+    "| {Beschreibung} "
+    "| `{CSS-Selektor}` "
+    "| {Skalierung} "
+    "| {Gemessene Größe (px)} "
+    "| {Erwartet (px)} "
+    "| {Status} "
+    "| {Abweichung} |\n"
+)
 
 FONT_SCALES = [
     ("S", 0.875, 12),
@@ -48,46 +85,176 @@ def set_font_scale(driver, scale_value):
             document.documentElement.style.setProperty('--ui-font-scale', '{scale_value}');
             document.dispatchEvent(new CustomEvent('uiFontScaleChange', {{detail: {{value: {scale_value}}}}}));
         """)
-        time.sleep(0.5)
+        # No sleep here: callers gate on wait_for_render_settle, which blocks
+        # exactly until the style recalc for the new scale has committed.
         return True
         
     except Exception as e:
         print(f"  Warning: Could not set font scale: {e}")
         return False
 
-def measure_font_size(driver, selector, component_name):
-    """Measure computed font size for a given selector"""
+def wait_for_render_settle(driver):
+    """Block until the style recalc after a scale change has committed.
+
+    Double requestAnimationFrame: the first frame picks up the mutated CSS
+    variable, the second guarantees styles are flushed. One async round-trip
+    per scale instead of a per-element WebDriverWait.
+    """
+    driver.execute_async_script("""
+        const done = arguments[arguments.length - 1];
+        requestAnimationFrame(() => requestAnimationFrame(done));
+    """)
+
+def measure_font_sizes(driver, selectors):
+    """Measure computed font sizes for all selectors in a single JS call.
+
+    Goes through CDP Runtime.evaluate where available, which skips the
+    chromedriver JSON translation layer of a regular execute_script.
+    Missing elements come back as None instead of raising.
+    """
+    selectors_json = json.dumps([comp["selector"] for comp in selectors])
+    # try/catch per selector: a typo'd selector in the config makes
+    # querySelector throw, and that should count as "Nicht gefunden"
+    # for one row, not kill the whole run.
+    expression = f"""
+        {selectors_json}.map(s => {{
+            try {{
+                const el = document.querySelector(s);
+                return el ? parseFloat(window.getComputedStyle(el).fontSize) : null;
+            }} catch (e) {{
+                return null;
+            }}
+        }})
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True
+        })
+        details = result.get("exceptionDetails")
+        if details:
+            raise RuntimeError(
+                "Runtime.evaluate failed: "
+                f"{details.get('exception', {}).get('description', details.get('text', 'unknown error'))}"
+            )
+        return result["result"]["value"]
+    # Non-Chromium drivers only; Remote built with Chrome Options exposes
+    # execute_cdp_cmd too. Parenthesized so ASI can't truncate the return.
+    return driver.execute_script(f"return ({expression});")
+
+def save_session(driver):
+    """Persist session id + executor URL so the next run can reconnect"""
     try:
-        # Wait for element to be present
-        WebDriverWait(driver, 3).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-        )
-        
-        el = driver.find_element(By.CSS_SELECTOR, selector)
-        
-        # Get computed font-size
-        size = driver.execute_script("""
-            return window.getComputedStyle(arguments[0]).fontSize;
-        """, el)
-        
-        # Also get the CSS rule source if possible
-        css_source = driver.execute_script("""
-            const el = arguments[0];
-            const computed = window.getComputedStyle(el);
-            return computed.fontSize;
-        """, el)
-        
-        return float(size.replace("px", "")), "✓", None
-        
-    except TimeoutException:
-        return None, "Timeout", "Element nicht innerhalb von 3s gefunden"
-    except NoSuchElementException:
-        return None, "Nicht gefunden", "Selektor matched kein Element"
+        with open(SESSION_CACHE, "w", encoding="utf-8") as f:
+            json.dump({
+                "executor_url": driver.command_executor._url,
+                "session_id": driver.session_id
+            }, f)
+    except OSError:
+        pass
+
+def clear_session_cache():
+    try:
+        os.remove(SESSION_CACHE)
+    except OSError:
+        pass
+
+def port_listening(port):
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+def ensure_chromedriver(port=CHROMEDRIVER_PORT):
+    """Start (or reuse) a chromedriver detached from this process.
+
+    Selenium's Service stops its child when the interpreter exits, which
+    would take the reusable session with it - so the persistent
+    chromedriver is launched via a plain detached Popen and simply reused
+    whenever the port is already listening. Returns the executor URL, or
+    None when no chromedriver binary is on PATH.
+    """
+    url = f"http://localhost:{port}"
+    if port_listening(port):
+        return url
+
+    chromedriver = shutil.which("chromedriver")
+    if chromedriver is None:
+        return None
+
+    subprocess.Popen(
+        [chromedriver, f"--port={port}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        if port_listening(port):
+            return url
+        time.sleep(0.05)
+    return None
+
+def try_reconnect():
+    """Reattach to the Chrome session left running by a previous run.
+
+    Returns a driver bound to the cached session, or None if there is no
+    cache or the session has died. Saves the ~2-4 s browser bring-up on
+    repeated measurement runs.
+    """
+    try:
+        with open(SESSION_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError, KeyError):
+        return None
+
+    remote_cls = webdriver.remote.webdriver.WebDriver
+    original_execute = remote_cls.execute
+
+    def reuse_execute(self, command, params=None):
+        # Intercept the newSession handshake and hand back the cached id
+        if command == "newSession":
+            return {"value": {"sessionId": cached["session_id"], "capabilities": {}}}
+        return original_execute(self, command, params)
+
+    try:
+        remote_cls.execute = reuse_execute
+        try:
+            driver = webdriver.Remote(
+                command_executor=cached["executor_url"],
+                options=Options()
+            )
+        finally:
+            remote_cls.execute = original_execute
+        driver.title  # probe; raises if the session is gone
+        driver._uno_persistent = True
+        return driver
+    except Exception:
+        clear_session_cache()
+        return None
+
+def block_subresources(driver):
+    """Block image/font/media requests via CDP Network.setBlockedURLs.
+
+    No-op for drivers without execute_cdp_cmd (non-Chromium).
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     except Exception as e:
-        return None, "Fehler", str(e)
+        print(f"  Warning: Konnte Subressourcen nicht blockieren: {e}")
+
+def init_driver(headless=True, reuse_session=True, port=CHROMEDRIVER_PORT, cache_session=True):
+    """Initialize Chrome WebDriver, reconnecting to a cached session if possible"""
+    if reuse_session:
+        driver = try_reconnect()
+        if driver is not None:
+            print("Reusing existing Chrome session")
+            return driver
 
-def init_driver(headless=True):
-    """Initialize Chrome WebDriver"""
     chrome_options = Options()
     if headless:
         chrome_options.add_argument("--headless=new")
@@ -96,12 +263,46 @@ def init_driver(headless=True):
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    # Shut down subsystems irrelevant to style measurement; keeps RAM and
+    # process count low enough to run the full 5-driver pool comfortably.
+    chrome_options.add_argument(
+        "--disable-features=TranslateUI,BackForwardCache,"
+        "InterestFeedContentSuggestions,CalculateNativeWinOcclusion,"
+        "OptimizationHints"
+    )
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    chrome_options.page_load_strategy = 'eager'
+    # We only need computed styles once React has mounted, so don't block
+    # driver.get on subresources; wait_for_app_ready gates readiness instead.
+    chrome_options.page_load_strategy = 'none'
     
     try:
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = None
+        if cache_session:
+            # Only a detached chromedriver outlives this process; a
+            # Service-owned one is stopped at interpreter exit and the
+            # session with it.
+            executor_url = ensure_chromedriver(port)
+            if executor_url is not None:
+                driver = webdriver.Remote(
+                    command_executor=executor_url,
+                    options=chrome_options
+                )
+                driver._uno_persistent = True
+        if driver is None:
+            driver = webdriver.Chrome(service=Service(port=port), options=chrome_options)
+            driver._uno_persistent = False
         driver.set_page_load_timeout(30)
+        block_subresources(driver)
+        if cache_session and driver._uno_persistent:
+            save_session(driver)
         return driver
     except Exception as e:
         print(f"Error initializing Chrome driver: {e}")
@@ -110,6 +311,186 @@ def init_driver(headless=True):
         print("  brew install chromedriver")
         sys.exit(1)
 
+def wait_for_app_ready(driver, timeout=10.0, interval=0.05):
+    """Poll until React has mounted into #root (or an explicit ready signal).
+
+    Replaces the fixed 3 s hydration sleep; returns as soon as the app is
+    actually there, or False after the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            ready = driver.execute_script("""
+                return !!document.querySelector('[data-app-ready]')
+                    || !!window.__APP_READY__
+                    || (document.querySelector('#root')?.childElementCount > 0);
+            """)
+        except Exception:
+            ready = False  # document may not exist yet with strategy 'none'
+        if ready:
+            return True
+        time.sleep(interval)
+    return False
+
+def load_app(driver, url):
+    """Load the application and wait for React to hydrate"""
+    try:
+        driver.get(url)
+    except Exception as e:
+        print(f"Error loading page: {e}")
+        print("Retrying...")
+        time.sleep(2)
+        driver.get(url)
+
+    WebDriverWait(driver, 15).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+    if not wait_for_app_ready(driver):
+        print("  Warning: App-Readiness nicht bestätigt, messe trotzdem...")
+
+def build_driver_pool(size, url, primary, headless=True):
+    """Pre-warm one driver per scale, each with the app already loaded.
+
+    `primary` is the already-loaded first driver (the only one that may
+    hold the cached session); the rest are fresh instances on
+    auto-assigned chromedriver ports.
+    """
+    drivers = [primary]
+    for _ in range(size - 1):
+        drivers.append(init_driver(
+            headless=headless, reuse_session=False,
+            port=0, cache_session=False
+        ))
+
+    pool = queue.Queue()
+    pool.put(primary)
+    for driver in drivers[1:]:
+        load_app(driver, url)
+        pool.put(driver)
+    return pool, drivers
+
+def get_css_signature(driver):
+    """Fingerprint the loaded stylesheets (hrefs plus rule counts)"""
+    try:
+        raw = driver.execute_script("""
+            return [...document.styleSheets].map(s => {
+                let rules = 0;
+                try { rules = s.cssRules.length; } catch (e) {}
+                return (s.href || 'inline') + ':' + rules;
+            }).join('|');
+        """)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    except Exception:
+        return None
+
+def get_run_signature(driver, selectors, url):
+    """Fingerprint everything the cached rows depend on.
+
+    Covers the loaded stylesheets, the selector config and the target
+    URL - editing font_selectors.json must invalidate the cache even
+    when the CSS bundle is untouched.
+    """
+    css_sig = get_css_signature(driver)
+    if css_sig is None:
+        return None
+    digest = hashlib.sha256()
+    digest.update(css_sig.encode("utf-8"))
+    digest.update(json.dumps(selectors, sort_keys=True).encode("utf-8"))
+    digest.update(url.encode("utf-8"))
+    return digest.hexdigest()
+
+def load_cached_results(run_sig):
+    """Return the previous run's rows if the run signature still matches"""
+    if run_sig is None:
+        return None
+    try:
+        with open(REPORT_CACHE, "rb") as f:
+            raw = f.read()
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if cached.get("run_sig") != run_sig:
+        return None
+    return cached.get("results")
+
+def save_cached_results(run_sig, results):
+    if run_sig is None:
+        return
+    payload = {"run_sig": run_sig, "results": results}
+    try:
+        with open(REPORT_CACHE, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                # default=int flattens the np.int8 deviations
+                f.write(json.dumps(payload, default=int).encode("utf-8"))
+    except (OSError, TypeError):
+        pass
+
+def measure_scale(driver_pool, selectors, label, scale, expected_px):
+    """Measure all components at one font scale using a pooled driver"""
+    driver = driver_pool.get()
+    try:
+        set_font_scale(driver, scale)
+        wait_for_render_settle(driver)
+        sizes = measure_font_sizes(driver, selectors)
+    finally:
+        driver_pool.put(driver)
+
+    # Vectorized deviation math: missing elements become NaN, the diff and
+    # 1px-tolerance check run in C instead of per-row Python.
+    measured = np.array(
+        [np.nan if size is None else size for size in sizes],
+        dtype=np.float64
+    )
+    diff = np.round(measured - expected_px, 2)
+    status = np.where(np.abs(diff) <= 1.0, "✓", "✗")
+    # Deviations live in a byte each (deci-px, so ±12.7px range) until the
+    # report is rendered; large selector catalogs stay 8x smaller in memory.
+    # NaN entries (missing elements) are zeroed before the cast - their
+    # dev_i8 value is never read, but NaN->int casts warn on numpy >= 1.24.
+    dev_i8 = np.clip(np.round(np.nan_to_num(diff) * 10), -127, 127).astype(np.int8)
+
+    rows = []
+    for i, comp in enumerate(selectors):
+        name = comp["name"]
+        selector = comp["selector"]
+        description = comp.get("description", "")
+
+        if np.isnan(measured[i]):
+            print(f"  [{label}] {name}: Nicht gefunden")
+            rows.append({
+                "Komponente": name,
+                "Beschreibung": description,
+                "CSS-Selektor": selector,
+                "Skalierung": label,
+                "Gemessene Größe (px)": "Nicht gefunden",
+                "Erwartet (px)": expected_px,
+                "Status": "✗",
+                "Abweichung": "Selektor matched kein Element"
+            })
+            continue
+
+        print(f"  [{label}] {name}: {measured[i]}px (expected {expected_px}px, diff: {diff[i]}px) {status[i]}")
+
+        rows.append({
+            "Komponente": name,
+            "Beschreibung": description,
+            "CSS-Selektor": selector,
+            "Skalierung": label,
+            "Gemessene Größe (px)": f"{measured[i]:.1f}",
+            "Erwartet (px)": expected_px,
+            "Status": status[i],
+            "Abweichung": dev_i8[i]
+        })
+    return rows
+
+def format_deviation(dev):
+    """Render a deci-px int8 deviation for the report; error strings pass through"""
+    if isinstance(dev, str):
+        return dev
+    return f"{dev / 10:+.1f}"
+
 def main():
     parser = argparse.ArgumentParser(
         description="Font size measurement for Arduino Simulator UI"
@@ -139,6 +520,21 @@ def main():
         action="store_true",
         help="Run browser in visible mode"
     )
+    parser.add_argument(
+        "--fresh-driver",
+        action="store_true",
+        help="Start a new browser instead of reusing a cached session"
+    )
+    parser.add_argument(
+        "--quit-browser",
+        action="store_true",
+        help="Close the browser on exit instead of keeping it for the next run"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-measure even if CSS, selectors and URL are unchanged"
+    )
     args = parser.parse_args()
 
     print(f"Loading selectors from {args.config}...")
@@ -146,132 +542,107 @@ def main():
     print(f"Found {len(selectors)} components to measure\n")
 
     print(f"Starting Chrome browser (headless={not args.no_headless})...")
-    driver = init_driver(headless=not args.no_headless)
-    
+    primary = init_driver(
+        headless=not args.no_headless,
+        reuse_session=not args.fresh_driver
+    )
+    drivers = [primary]
+
     try:
         print(f"Loading application from {args.url}...")
-        try:
-            driver.get(args.url)
-        except Exception as e:
-            print(f"Error loading page: {e}")
-            print("Retrying...")
-            time.sleep(2)
-            driver.get(args.url)
-        
-        # Wait for page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(3)  # Extra time for React to hydrate
+        load_app(primary, args.url)
         print("Application loaded successfully\n")
 
-        results = []
-        
-        for label, scale, expected_px in FONT_SCALES:
-            print(f"Testing scale {label} ({expected_px}px)...")
-            set_font_scale(driver, scale)
-            time.sleep(0.5)
-            
-            for comp in selectors:
-                name = comp["name"]
-                selector = comp["selector"]
-                description = comp.get("description", "")
-                
-                print(f"  Measuring: {name}...")
-                measured, status, error = measure_font_size(driver, selector, name)
-                
-                abweichung = ""
-                if measured is not None:
-                    abweichung = round(measured - expected_px, 2)
-                    # More lenient threshold: 1px tolerance
-                    status = "✓" if abs(abweichung) <= 1.0 else "✗"
-                    print(f"    → {measured}px (expected {expected_px}px, diff: {abweichung}px) {status}")
-                else:
-                    measured_str = f"{status}"
-                    if error:
-                        print(f"    → {status}: {error}")
-                    results.append({
-                        "Komponente": name,
-                        "Beschreibung": description,
-                        "CSS-Selektor": selector,
-                        "Skalierung": label,
-                        "Gemessene Größe (px)": measured_str,
-                        "Erwartet (px)": expected_px,
-                        "Status": "✗",
-                        "Abweichung": error or "N/A"
-                    })
-                    continue
-                
-                results.append({
-                    "Komponente": name,
-                    "Beschreibung": description,
-                    "CSS-Selektor": selector,
-                    "Skalierung": label,
-                    "Gemessene Größe (px)": f"{measured:.1f}",
-                    "Erwartet (px)": expected_px,
-                    "Status": status,
-                    "Abweichung": f"{abweichung:+.1f}" if abweichung != "" else ""
-                })
-            
+        run_sig = get_run_signature(primary, selectors, args.url)
+        results = None if args.no_cache else load_cached_results(run_sig)
+        if results is not None:
+            print("CSS, Selektoren und URL unverändert - Bericht wird aus dem Cache erzeugt.\n")
+        else:
+            print(f"Starting {len(FONT_SCALES) - 1} additional Chrome browsers...")
+            driver_pool, drivers = build_driver_pool(
+                len(FONT_SCALES), args.url, primary,
+                headless=not args.no_headless
+            )
+
+            # Each scale is an independent page state, so sweep them
+            # concurrently: one pooled driver per scale.
+            with ThreadPoolExecutor(max_workers=len(FONT_SCALES)) as executor:
+                futures = [
+                    executor.submit(measure_scale, driver_pool, selectors, label, scale, expected_px)
+                    for label, scale, expected_px in FONT_SCALES
+                ]
+                results = []
+                for future in futures:
+                    results.extend(future.result())
+            save_cached_results(run_sig, results)
             print()
 
-        # Write Markdown report
+        # Write Markdown report: build everything in memory, one write call
         print(f"Writing report to {args.output}...")
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write("# Font Size Measurement Report\n\n")
-            f.write(f"**Datum:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"**URL:** {args.url}\n\n")
-            f.write("## Ergebnisse\n\n")
-            f.write("| Komponente | Beschreibung | CSS-Selektor | Skalierung | Gemessen (px) | Erwartet (px) | Status | Abweichung |\n")
-            f.write("|------------|--------------|--------------|------------|---------------|---------------|--------|------------|\n")
-            for row in results:
-                f.write(
-                    f"| {row['Komponente']} "
-                    f"| {row['Beschreibung']} "
-                    f"| `{row['CSS-Selektor']}` "
-                    f"| {row['Skalierung']} "
-                    f"| {row['Gemessene Größe (px)']} "
-                    f"| {row['Erwartet (px)']} "
-                    f"| {row['Status']} "
-                    f"| {row['Abweichung']} |\n"
-                )
-            
-            # Summary
-            f.write("\n## Zusammenfassung\n\n")
-            total = len(results)
-            passed = sum(1 for r in results if r['Status'] == '✓')
-            failed = total - passed
-            f.write(f"- **Gesamt:** {total} Messungen\n")
-            f.write(f"- **Bestanden:** {passed} ({100*passed/total:.1f}%)\n")
-            f.write(f"- **Fehlgeschlagen:** {failed} ({100*failed/total:.1f}%)\n")
-
-        # Write CSV
+        parts = [
+            "# Font Size Measurement Report\n\n",
+            f"**Datum:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            f"**URL:** {args.url}\n\n",
+            "## Ergebnisse\n\n",
+            "| Komponente | Beschreibung | CSS-Selektor | Skalierung | Gemessen (px) | Erwartet (px) | Status | Abweichung |\n",
+            "|------------|--------------|--------------|------------|---------------|---------------|--------|------------|\n",
+        ]
+        parts.append("".join(
+            MD_ROW_FMT.format_map(
+                {**row, "Abweichung": format_deviation(row["Abweichung"])}
+            )
+            for row in results
+        ))
+
+        # Summary
+        parts.append("\n## Zusammenfassung\n\n")
+        total = len(results)
+        passed = sum(1 for r in results if r['Status'] == '✓')
+        failed = total - passed
+        parts.append(f"- **Gesamt:** {total} Messungen\n")
+        parts.append(f"- **Bestanden:** {passed} ({100*passed/total:.1f}%)\n")
+        parts.append(f"- **Fehlgeschlagen:** {failed} ({100*failed/total:.1f}%)\n")
+        Path(args.output).write_text("".join(parts), encoding="utf-8")
+
+        # Write CSV via an in-memory buffer, flushed with a single write
         print(f"Writing CSV to {args.csv}...")
-        with open(args.csv, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
+        csv_buf = io.StringIO()
+        writer = csv.writer(csv_buf)
+        writer.writerow([
+            "Komponente", "Beschreibung", "CSS-Selektor", "Skalierung",
+            "Gemessene Größe (px)", "Erwartet (px)", "Status", "Abweichung"
+        ])
+        for row in results:
             writer.writerow([
-                "Komponente", "Beschreibung", "CSS-Selektor", "Skalierung",
-                "Gemessene Größe (px)", "Erwartet (px)", "Status", "Abweichung"
+                row["Komponente"],
+                row["Beschreibung"],
+                row["CSS-Selektor"],
+                row["Skalierung"],
+                row["Gemessene Größe (px)"],
+                row["Erwartet (px)"],
+                row["Status"],
+                format_deviation(row["Abweichung"])
             ])
-            for row in results:
-                writer.writerow([
-                    row["Komponente"],
-                    row["Beschreibung"],
-                    row["CSS-Selektor"],
-                    row["Skalierung"],
-                    row["Gemessene Größe (px)"],
-                    row["Erwartet (px)"],
-                    row["Status"],
-                    row["Abweichung"]
-                ])
+        with open(args.csv, "w", encoding="utf-8", newline="") as f:
+            f.write(csv_buf.getvalue())
 
         print(f"\n✅ Fertig! Ergebnisse in:")
         print(f"   - {args.output}")
         print(f"   - {args.csv}")
         
     finally:
-        driver.quit()
-        print("\nBrowser geschlossen.")
+        # The first driver owns the cached session; keep it alive for the
+        # next run unless --quit-browser was given. Pool extras always
+        # quit, and so does a primary whose chromedriver would die with
+        # this process anyway - claiming it survives would be a lie.
+        for driver in drivers[1:]:
+            driver.quit()
+        if args.quit_browser or not getattr(drivers[0], "_uno_persistent", False):
+            clear_session_cache()
+            drivers[0].quit()
+            print("\nBrowser geschlossen.")
+        else:
+            print("\nBrowser-Session bleibt für den nächsten Lauf aktiv.")
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,46 @@
 #!/usr/bin/env python3
+import json
+import mmap
 import re
 import os
+import subprocess
+
+# C-extension JSON for the audit file; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer a linear-time AST walk over the backtracking-prone regex when a
+# TSX grammar is available (pip install tree_sitter_languages)
+try:
+    from tree_sitter_languages import get_language, get_parser
+    TSX_LANGUAGE = get_language('tsx')
+    TSX_PARSER = get_parser('tsx')
+    BUTTON_QUERY = TSX_LANGUAGE.query("""
+        (jsx_opening_element
+            name: (identifier) @tag
+            (#eq? @tag "Button")) @el
+        (jsx_self_closing_element
+            name: (identifier) @tag
+            (#eq? @tag "Button")) @el
+    """)
+except Exception:
+    # Not just ImportError: tree_sitter_languages does not pin tree_sitter,
+    # and get_language() raises TypeError next to a modern (>=0.23) core.
+    # Any failure here just means we use the regex fallback.
+    BUTTON_QUERY = None
+
+# Compiled once at import; the scan runs them against every candidate file
+BUTTON_RE = re.compile(r"<Button([\s\S]{0,400}?)(?:>|/>)")
+CLS_STR_RE = re.compile(r'className\s*=\s*\{?\s*"([^"]+)"\s*\}?')
+CLS_CLSX_RE = re.compile(r'className\s*=\s*\{\s*clsx\(([^\)]*)\)\s*\}')
+CLSX_RE = re.compile(r"clsx\(([^\)]*)\)")
+WS_RE = re.compile(r"\s+")
+WIDTH_RE = re.compile(r"w-\[[^\]]+\]|w-\d+|w-\d+\/\d+|w-\d+")
+
+SRC_EXTS = ('.tsx', '.ts', '.jsx', '.js')
+SKIP_DIRS = {'node_modules', 'dist', '.git'}
 
 # Tailwind height token to px mapping (assuming root 16px)
 TW_H_MAP = {
@@ -17,71 +57,191 @@ TW_H_MAP = {
 ROOT = os.path.join(os.path.dirname(__file__), '..', 'client', 'src')
 results = []
 
-for dirpath, _, filenames in os.walk(ROOT):
-    for fn in filenames:
-        if not fn.endswith(('.tsx', '.ts', '.jsx', '.js')):
+def iter_source_files(root):
+    """Yield .ts/.tsx/.js/.jsx paths via os.scandir, skipping build dirs"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(SRC_EXTS):
+                    yield entry.path
+
+def class_text_from_value(node, data):
+    """Resolve a className attribute value node to its class string.
+
+    Strings and template strings yield their inner text; call expressions
+    like clsx("a", cond && "b") yield every string literal argument joined
+    with spaces - the legacy clsx regex truncated at the first nested
+    paren, which mangled classes like h-[var(--ui-button-height)].
+    """
+    if node.type == 'jsx_expression':
+        inner = next((c for c in node.named_children if c.type != 'comment'), None)
+        if inner is None:
+            return ''
+        node = inner
+    if node.type in ('string', 'template_string'):
+        # strip the surrounding quotes/backticks
+        return data[node.start_byte + 1:node.end_byte - 1].decode('utf-8')
+    if node.type == 'call_expression':
+        parts = []
+        stack = list(node.named_children)
+        while stack:
+            child = stack.pop(0)
+            if child.type in ('string', 'template_string'):
+                parts.append(data[child.start_byte + 1:child.end_byte - 1].decode('utf-8'))
+            else:
+                stack.extend(child.named_children)
+        return ' '.join(parts)
+    # conditionals, identifiers etc.: fall back to the raw source text
+    return data[node.start_byte:node.end_byte].decode('utf-8')
+
+def button_class_text(el_node, data):
+    """Pull the className text out of a Button element's AST attributes"""
+    for attr in el_node.named_children:
+        if attr.type != 'jsx_attribute' or not attr.named_children:
+            continue
+        name = attr.named_children[0]
+        if data[name.start_byte:name.end_byte] != b'className':
+            continue
+        if len(attr.named_children) < 2:
+            return ''  # bare className with no value
+        return class_text_from_value(attr.named_children[1], data)
+    return ''
+
+def iter_button_chunks(buf):
+    """Yield (attribute_text, class_text) for each <Button ...> element.
+
+    Accepts an mmap or bytes. With tree-sitter the elements come from a
+    TSX parse - which also catches JSX forms the 400-byte regex window
+    misses and cannot backtrack pathologically on minified sources - and
+    className is read straight off the jsx_attribute node. Without it,
+    walk the byte-level find() hits, regex only the small window around
+    each one, and hand back class_text=None so the caller runs the legacy
+    regex extraction on the attribute text.
+    """
+    if BUTTON_QUERY is not None:
+        data = bytes(buf)
+        tree = TSX_PARSER.parse(data)
+        for node, capture in BUTTON_QUERY.captures(tree.root_node):
+            if capture != 'el':
+                continue
+            element = data[node.start_byte:node.end_byte].decode('utf-8')
+            # Old py-tree-sitter (<0.21) silently skips #eq? predicates in
+            # captures(), yielding every JSX element; re-check the tag here
+            # instead of trusting the query. The char after '<Button' must
+            # end the name so <ButtonGroup .../> is not swept in.
+            if not element.startswith('<Button') or (
+                len(element) > 7 and element[7] not in ' \t\r\n>/'
+            ):
+                continue
+            # mirror the regex group: attributes only, no tag name or bracket
+            chunk = element[len('<Button'):].rstrip('>').rstrip('/')
+            yield chunk, button_class_text(node, data)
+        return
+
+    pos = buf.find(b'<Button')
+    while pos >= 0:
+        # 420 bytes covers the tag plus the regex's 400-char attribute cap
+        window = bytes(buf[pos:pos + 420]).decode('utf-8', errors='replace')
+        m = BUTTON_RE.match(window)
+        if m:
+            yield m.group(1), None
+            pos = buf.find(b'<Button', pos + m.end())
+        else:
+            pos = buf.find(b'<Button', pos + 7)
+
+def find_candidate_files(root):
+    """List files actually containing '<Button', via ripgrep when available.
+
+    rg does the coarse substring filter in one fast traversal so Python
+    only regex-parses the survivors. Falls back to the scandir walk when
+    rg is not installed.
+    """
+    try:
+        proc = subprocess.run(
+            ['rg', '-l', '--fixed-strings', '-g', '*.{ts,tsx,js,jsx}', '<Button', root],
+            capture_output=True, text=True
+        )
+    except OSError:
+        return list(iter_source_files(root))
+    if proc.returncode > 1:  # 0 = matches, 1 = none; anything else is an rg error
+        return list(iter_source_files(root))
+    # one path per line; split() would shred paths containing spaces
+    return proc.stdout.splitlines()
+
+for path in find_candidate_files(ROOT):
+    # mmap lets the kernel page cache back the scan; the cheap bytes-level
+    # find skips decoding files without any Button usage (fallback path).
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
             continue
-        path = os.path.join(dirpath, fn)
-        with open(path, 'r', encoding='utf-8') as f:
-            text = f.read()
-        for m in re.finditer(r"<Button([\s\S]{0,400}?)(?:>|/>)", text):
-            chunk = m.group(1)
-            # find className="..."
-            cls_match = re.search(r'className\s*=\s*\{?\s*"([^"]+)"\s*\}?', chunk)
+        with mm:
+            if mm.find(b'<Button') < 0:
+                continue
+            chunks = list(iter_button_chunks(mm))
+    for chunk, cls_text in chunks:
+        if cls_text is None:
+            # regex fallback: find className="..."
+            cls_match = CLS_STR_RE.search(chunk)
             if not cls_match:
-                cls_match = re.search(r'className\s*=\s*\{\s*clsx\(([^\)]*)\)\s*\}', chunk)
+                cls_match = CLS_CLSX_RE.search(chunk)
             cls_text = cls_match.group(1) if cls_match else ''
             # also search for className={clsx('...','...')}
             if 'clsx' in chunk and not cls_match:
-                cx = re.search(r"clsx\(([^\)]*)\)", chunk)
+                cx = CLSX_RE.search(chunk)
                 if cx:
                     cls_text = cx.group(1)
-            # collapse whitespace
-            cls_text = re.sub(r"\s+", " ", cls_text.strip())
-
-            # find explicit width classes
-            w_match = re.search(r"w-\[[^\]]+\]|w-\d+|w-\d+\/\d+|w-\d+", cls_text)
-            # find explicit height classes (either Tailwind token or var[])
-            h_var = 'h-[var(--ui-button-height)]' in cls_text
-            h_token = None
-            for token in TW_H_MAP.keys():
-                if token in cls_text:
-                    h_token = token
-                    break
-
-            # determine expected px
-            if h_var:
-                height_px = '32px (var(--ui-button-height))'
-            elif h_token:
-                height_px = TW_H_MAP.get(h_token, 'unknown')
+        # collapse whitespace
+        cls_text = WS_RE.sub(" ", cls_text.strip())
+
+        # find explicit width classes
+        w_match = WIDTH_RE.search(cls_text)
+        # find explicit height classes (either Tailwind token or var[])
+        h_var = 'h-[var(--ui-button-height)]' in cls_text
+        h_token = None
+        for token in TW_H_MAP.keys():
+            if token in cls_text:
+                h_token = token
+                break
+
+        # determine expected px
+        if h_var:
+            height_px = '32px (var(--ui-button-height))'
+        elif h_token:
+            height_px = TW_H_MAP.get(h_token, 'unknown')
+        else:
+            # fallback: might rely on button component default
+            height_px = 'button-variant-default (32px expected)'
+
+        # width
+        if w_match:
+            w = w_match.group(0)
+            if w == 'w-[var(--ui-button-height)]':
+                width_px = '32px (var(--ui-button-height))'
+            elif w.startswith('w-') and w[2:].isdigit():
+                # tailwind numeric width like w-32 -> 8rem = 128px (approx)
+                width_px = w
             else:
-                # fallback: might rely on button component default
-                height_px = 'button-variant-default (32px expected)'
-
-            # width
-            if w_match:
-                w = w_match.group(0)
-                if w == 'w-[var(--ui-button-height)]':
-                    width_px = '32px (var(--ui-button-height))'
-                elif w.startswith('w-') and w[2:].isdigit():
-                    # tailwind numeric width like w-32 -> 8rem = 128px (approx)
-                    width_px = w
-                else:
-                    width_px = w
+                width_px = w
+        else:
+            # no explicit width; if token is icon-size or square pattern, width may match height
+            if 'icon' in chunk or 'size="icon"' in chunk:
+                width_px = '32px (icon -> square)'
             else:
-                # no explicit width; if token is icon-size or square pattern, width may match height
-                if 'icon' in chunk or 'size="icon"' in chunk:
-                    width_px = '32px (icon -> square)'
-                else:
-                    width_px = 'auto / content'
-
-            results.append({
-                'file': os.path.relpath(path, os.path.join(os.path.dirname(__file__), '..')),
-                'snippet': chunk.strip().split('\n')[0].strip(),
-                'className': cls_text,
-                'height': height_px,
-                'width': width_px,
-            })
+                width_px = 'auto / content'
+
+        results.append({
+            'file': os.path.relpath(path, os.path.join(os.path.dirname(__file__), '..')),
+            'snippet': chunk.strip().split('\n')[0].strip(),
+            'className': cls_text,
+            'height': height_px,
+            'width': width_px,
+        })
 
 # Print results
 print('\nButton usage audit (expected computed sizes):\n')
@@ -94,7 +254,9 @@ for r in results:
 
 # Save as json
 out = os.path.join(os.path.dirname(__file__), '..', 'button-size-audit.json')
-with open(out, 'w') as f:
-    import json
-    json.dump(results, f, indent=2)
+with open(out, 'wb') as f:
+    if orjson is not None:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        f.write(json.dumps(results, indent=2).encode('utf-8'))
 print('Saved audit to:', out)